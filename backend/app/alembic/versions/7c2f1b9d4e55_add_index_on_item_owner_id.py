@@ -0,0 +1,25 @@
+"""Add index on item owner_id
+
+Revision ID: 7c2f1b9d4e55
+Revises: 1a31ce608336
+Create Date: 2025-08-29 10:15:02.318274
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = '7c2f1b9d4e55'
+down_revision = '1a31ce608336'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(op.f('ix_item_owner_id'), 'item', ['owner_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_item_owner_id'), table_name='item')
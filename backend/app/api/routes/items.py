@@ -2,6 +2,7 @@ import uuid
 from typing import Any
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 from sqlmodel import func, select
 
 from app.api.deps import CurrentUser, SessionDep
@@ -18,27 +19,16 @@ def read_items(
     Retrieve items.
     """
 
-    if current_user.is_superuser:
-        count_statement = select(func.count()).select_from(Item)
-        count = session.exec(count_statement).one()
-        statement = select(Item).offset(skip).limit(limit)
-        items = session.exec(statement).all()
-    else:
-        count_statement = (
-            select(func.count())
-            .select_from(Item)
-            .where(Item.owner_id == current_user.id)
-        )
-        count = session.exec(count_statement).one()
-        statement = (
-            select(Item)
-            .where(Item.owner_id == current_user.id)
-            .offset(skip)
-            .limit(limit)
-        )
-        items = session.exec(statement).all()
+    statement = select(Item, func.count().over().label("total"))
+    if not current_user.is_superuser:
+        statement = statement.where(Item.owner_id == current_user.id)
+    rows = session.exec(statement.offset(skip).limit(limit)).all()
+    items = [item for item, _ in rows]
+    count = rows[0][1] if rows else 0
 
-    return ItemsPublic(data=items, count=count)
+    # Returning a Response skips FastAPI's response_model re-validation;
+    # the data has already been validated into ItemsPublic above
+    return ORJSONResponse(ItemsPublic(data=items, count=count).model_dump(mode="json"))
 
 
 @router.get("/{id}", response_model=ItemPublic)
@@ -84,8 +74,8 @@ def update_item(
         raise HTTPException(status_code=404, detail="Item not found")
     if not current_user.is_superuser and (item.owner_id != current_user.id):
         raise HTTPException(status_code=400, detail="Not enough permissions")
-    update_dict = item_in.model_dump(exclude_unset=True)
-    item.sqlmodel_update(update_dict)
+    for field in item_in.__pydantic_fields_set__:
+        setattr(item, field, getattr(item_in, field))
     session.add(item)
     session.commit()
     session.refresh(item)
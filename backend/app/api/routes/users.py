@@ -1,8 +1,11 @@
 import uuid
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import col, delete, func, select
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select as sa_select
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import col, func
 
 from app import crud
 from app.api.deps import (
@@ -13,7 +16,6 @@ from app.api.deps import (
 from app.core.config import settings
 from app.core.security import get_password_hash, verify_password
 from app.models import (
-    Item,
     Message,
     UpdatePassword,
     User,
@@ -39,35 +41,53 @@ def read_users(session: SessionDep, skip: int = 0, limit: int = 100) -> Any:
     Retrieve users.
     """
 
-    count_statement = select(func.count()).select_from(User)
-    count = session.exec(count_statement).one()
-
-    statement = select(User).offset(skip).limit(limit)
-    users = session.exec(statement).all()
+    # Fetch only the UserPublic columns; keeps hashed_password out of the
+    # result set entirely. SQLAlchemy's select() here because SQLModel's
+    # overloads stop at four entities
+    statement = (
+        sa_select(
+            col(User.id),
+            col(User.email),
+            col(User.is_active),
+            col(User.is_superuser),
+            col(User.full_name),
+            func.count().over().label("total"),
+        )
+        .offset(skip)
+        .limit(limit)
+    )
+    rows = session.execute(statement).all()
+    users = [UserPublic.model_validate(row, from_attributes=True) for row in rows]
+    count = rows[0].total if rows else 0
 
-    return UsersPublic(data=users, count=count)
+    # Returning a Response skips FastAPI's response_model re-validation;
+    # the data has already been validated into UserPublic above
+    return ORJSONResponse(UsersPublic(data=users, count=count).model_dump(mode="json"))
 
 
 @router.post(
     "/", dependencies=[Depends(get_current_active_superuser)], response_model=UserPublic
 )
-def create_user(*, session: SessionDep, user_in: UserCreate) -> Any:
+def create_user(
+    *, session: SessionDep, user_in: UserCreate, background_tasks: BackgroundTasks
+) -> Any:
     """
     Create new user.
     """
-    user = crud.get_user_by_email(session=session, email=user_in.email)
-    if user:
+    try:
+        user = crud.create_user(session=session, user_create=user_in)
+    except IntegrityError:
+        session.rollback()
         raise HTTPException(
             status_code=400,
             detail="The user with this email already exists in the system.",
         )
-
-    user = crud.create_user(session=session, user_create=user_in)
     if settings.emails_enabled and user_in.email:
         email_data = generate_new_account_email(
             email_to=user_in.email, username=user_in.email, password=user_in.password
         )
-        send_email(
+        background_tasks.add_task(
+            send_email,
             email_to=user_in.email,
             subject=email_data.subject,
             html_content=email_data.html_content,
@@ -89,8 +109,8 @@ def update_user_me(
             raise HTTPException(
                 status_code=409, detail="User with this email already exists"
             )
-    user_data = user_in.model_dump(exclude_unset=True)
-    current_user.sqlmodel_update(user_data)
+    for field in user_in.__pydantic_fields_set__:
+        setattr(current_user, field, getattr(user_in, field))
     session.add(current_user)
     session.commit()
     session.refresh(current_user)
@@ -144,14 +164,15 @@ def register_user(session: SessionDep, user_in: UserRegister) -> Any:
     """
     Create new user without the need to be logged in.
     """
-    user = crud.get_user_by_email(session=session, email=user_in.email)
-    if user:
+    user_create = UserCreate.model_validate(user_in)
+    try:
+        user = crud.create_user(session=session, user_create=user_create)
+    except IntegrityError:
+        session.rollback()
         raise HTTPException(
             status_code=400,
             detail="The user with this email already exists in the system",
         )
-    user_create = UserCreate.model_validate(user_in)
-    user = crud.create_user(session=session, user_create=user_create)
     return user
 
 
@@ -219,8 +240,6 @@ def delete_user(
         raise HTTPException(
             status_code=403, detail="Super users are not allowed to delete themselves"
         )
-    statement = delete(Item).where(col(Item.owner_id) == user_id)
-    session.exec(statement)  # type: ignore
     session.delete(user)
     session.commit()
     return Message(message="User deleted successfully")
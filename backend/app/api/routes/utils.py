@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends
 from pydantic.networks import EmailStr
 
 from app.api.deps import get_current_active_superuser
+from app.core.db import engine
 from app.models import Message
 from app.utils import generate_test_email, send_email
 
@@ -26,6 +27,17 @@ def test_email(email_to: EmailStr) -> Message:
     return Message(message="Test email sent")
 
 
+@router.get(
+    "/db-pool-status/",
+    dependencies=[Depends(get_current_active_superuser)],
+)
+def db_pool_status() -> Message:
+    """
+    Report the database connection pool status.
+    """
+    return Message(message=engine.pool.status())
+
+
 @router.get("/health-check/")
 async def health_check() -> bool:
     return True
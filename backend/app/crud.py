@@ -1,11 +1,16 @@
 import uuid
 from typing import Any
 
+from sqlalchemy import bindparam
 from sqlmodel import Session, select
 
 from app.core.security import get_password_hash, verify_password
 from app.models import Item, ItemCreate, User, UserCreate, UserUpdate
 
+# Built once at import time; rebuilding and compiling this statement on
+# every call costs about as much as executing it
+_user_by_email_statement = select(User).where(User.email == bindparam("email"))
+
 
 def create_user(*, session: Session, user_create: UserCreate) -> User:
     db_obj = User.model_validate(
@@ -18,13 +23,14 @@ def create_user(*, session: Session, user_create: UserCreate) -> User:
 
 
 def update_user(*, session: Session, db_user: User, user_in: UserUpdate) -> Any:
-    user_data = user_in.model_dump(exclude_unset=True)
-    extra_data = {}
-    if "password" in user_data:
-        password = user_data["password"]
-        hashed_password = get_password_hash(password)
-        extra_data["hashed_password"] = hashed_password
-    db_user.sqlmodel_update(user_data, update=extra_data)
+    # Iterate the fields actually supplied instead of dumping the whole
+    # model to a dict; avoids re-walking unset fields on every update
+    for field in user_in.__pydantic_fields_set__:
+        value = getattr(user_in, field)
+        if field == "password":
+            db_user.hashed_password = get_password_hash(value)
+        else:
+            setattr(db_user, field, value)
     session.add(db_user)
     session.commit()
     session.refresh(db_user)
@@ -32,8 +38,9 @@ def update_user(*, session: Session, db_user: User, user_in: UserUpdate) -> Any:
 
 
 def get_user_by_email(*, session: Session, email: str) -> User | None:
-    statement = select(User).where(User.email == email)
-    session_user = session.exec(statement).first()
+    session_user = session.exec(
+        _user_by_email_statement, params={"email": email}
+    ).first()
     return session_user
 
 
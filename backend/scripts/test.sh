@@ -3,6 +3,9 @@
 set -e
 set -x
 
+# Low-cost hashing keeps the user-creation-heavy tests fast
+export BCRYPT_ROUNDS="${BCRYPT_ROUNDS:-4}"
+
 coverage run --source=app -m pytest
 coverage report --show-missing
 coverage html --title "${@-coverage}"